@@ -5,28 +5,32 @@ This file contains sample React-like components written in Python
 that can be transpiled to JavaScript using the PyReact transpiler.
 """
 
-from pyreact import Component, div, h1, h2, button, p, span, input_field, PyReactTranspiler
+import sys
+from dataclasses import dataclass
 
+from pyreact import Component, Text, component, div, h1, h2, button, p, span, input_, PyReactTranspiler
 
+
+@component
 class Counter(Component):
     """A simple counter component that demonstrates state management and event handling."""
     
-    def __init__(self, props=None):
-        super().__init__(props)
-        self.state = {'count': 0}
+    @dataclass(slots=True)
+    class State:
+        count: int = 0
     
     def increment(self):
-        self.set_state({'count': self.state['count'] + 1})
+        self.state.count += 1
     
     def decrement(self):
-        self.set_state({'count': self.state['count'] - 1})
+        self.state.count -= 1
     
     def reset(self):
-        self.set_state({'count': 0})
+        self.state.count = 0
     
     def render(self):
         return div(
-            h1(f"Count: {self.state['count']}"),
+            h1(Text("Count: ", self.state.count)),
             div(
                 button("Increment", onclick=self.increment),
                 button("Decrement", onclick=self.decrement),
@@ -35,6 +39,7 @@ class Counter(Component):
         )
 
 
+@component
 class Greeting(Component):
     """A greeting component that demonstrates props usage."""
     
@@ -55,6 +60,7 @@ class Greeting(Component):
         )
 
 
+@component
 class ClickTracker(Component):
     """A component that tracks button clicks and demonstrates multiple state properties."""
     
@@ -67,10 +73,10 @@ class ClickTracker(Component):
         }
     
     def handle_click(self):
-        self.set_state({
-            'clicks': self.state['clicks'] + 1,
-            'last_clicked': 'Just now'
-        })
+        def record_click(state):
+            state['clicks'] += 1
+            state['last_clicked'] = 'Just now'
+        self.mutate_state(record_click)
     
     def clear_stats(self):
         self.set_state({
@@ -82,8 +88,8 @@ class ClickTracker(Component):
     def render(self):
         return div(
             h2("Click Tracker"),
-            p(f"Total clicks: {self.state['clicks']}"),
-            p(f"Last clicked: {self.state['last_clicked']}"),
+            p(Text("Total clicks: ", self.state['clicks'])),
+            p(Text("Last clicked: ", self.state['last_clicked'])),
             div(
                 button("Click Me!", onclick=self.handle_click),
                 button("Clear Stats", onclick=self.clear_stats)
@@ -91,62 +97,70 @@ class ClickTracker(Component):
         )
 
 
+# Number of lines of the complete JavaScript bundle shown in the output
+PREVIEW_LINES = 40
+
+
 def main():
     """Main function to demonstrate the transpiler."""
-    print("PyReact Example - Transpiling Python Components to JavaScript")
-    print("=" * 60)
+    # Collect all output and write it in one go at the end
+    out = []
+    emit = out.append
+    
+    emit("PyReact Example - Transpiling Python Components to JavaScript")
+    emit("=" * 60)
     
     # Create transpiler instance
     transpiler = PyReactTranspiler()
     
-    # Transpile each component
-    print("\n1. Transpiling Counter component...")
-    counter_js = transpiler.transpile_component(Counter)
-    print("✓ Counter component transpiled successfully")
-    
-    print("\n2. Transpiling Greeting component...")
-    greeting_js = transpiler.transpile_component(Greeting)
-    print("✓ Greeting component transpiled successfully")
-    
-    print("\n3. Transpiling ClickTracker component...")
-    tracker_js = transpiler.transpile_component(ClickTracker)
-    print("✓ ClickTracker component transpiled successfully")
-    
-    # Display transpiled JavaScript for Counter
-    print("\n" + "=" * 60)
-    print("TRANSPILED JAVASCRIPT - Counter Component:")
-    print("=" * 60)
-    print(counter_js)
-    
-    # Generate complete JavaScript
-    print("\n" + "=" * 60)
-    print("COMPLETE JAVASCRIPT OUTPUT:")
-    print("=" * 60)
-    complete_js = transpiler.generate_complete_js()
-    print(complete_js)
+    # Transpile, bundle and write the HTML demo page in one pass
+    components = [Counter, Greeting, ClickTracker]
+    emit(f"\nBuilding {len(components)} components...")
     
-    # Generate HTML demo page
-    print("\n" + "=" * 60)
-    print("GENERATING HTML DEMO PAGE:")
-    print("=" * 60)
-    
-    components_to_render = ['Counter', 'Greeting', 'ClickTracker']
-    html_file = transpiler.save_html_demo(
-        components=components_to_render,
-        filename="pyreact_demo.html",
+    html_file = "pyreact_demo.html"
+    complete_js = transpiler.build(
+        components,
+        html_path=html_file,
         title="PyReact Demo - Python to JavaScript React Components"
     )
     
-    print(f"✓ HTML demo saved as: {html_file}")
-    print("✓ Open pyreact_demo.html in your browser to see the working components!")
+    for name in transpiler.components:
+        emit(f"✓ {name} component transpiled successfully")
+    
+    counter_js = transpiler.components['Counter']
+    
+    # Display transpiled JavaScript for Counter
+    emit("\n" + "=" * 60)
+    emit("TRANSPILED JAVASCRIPT - Counter Component:")
+    emit("=" * 60)
+    emit(counter_js)
+    
+    # Preview the complete JavaScript; the full bundle is in the HTML page
+    line_count = complete_js.count("\n") + (not complete_js.endswith("\n"))
+    emit("\n" + "=" * 60)
+    emit("COMPLETE JAVASCRIPT OUTPUT:")
+    emit("=" * 60)
+    emit("\n".join(complete_js.split("\n", PREVIEW_LINES)[:PREVIEW_LINES]))
+    if line_count > PREVIEW_LINES:
+        emit(f"... ({line_count} lines total)")
+    
+    # Report the HTML demo page written by build()
+    emit("\n" + "=" * 60)
+    emit("GENERATING HTML DEMO PAGE:")
+    emit("=" * 60)
+    emit(f"✓ HTML demo saved as: {html_file}")
+    emit("✓ Open pyreact_demo.html in your browser to see the working components!")
     
     # Display some stats
-    print("\n" + "=" * 60)
-    print("TRANSPILATION STATISTICS:")
-    print("=" * 60)
-    print(f"Components transpiled: {len(transpiler.components)}")
-    print(f"Total JavaScript lines: {len(complete_js.splitlines())}")
-    print(f"Component names: {', '.join(transpiler.components.keys())}")
+    emit("\n" + "=" * 60)
+    emit("TRANSPILATION STATISTICS:")
+    emit("=" * 60)
+    emit(f"Components transpiled: {len(transpiler.components)}")
+    emit(f"Total JavaScript lines: {line_count}")
+    emit(f"Component names: {', '.join(transpiler.components)}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
     
     return transpiler
 
@@ -6,9 +6,13 @@ enabling developers to write React applications using Python syntax.
 """
 
 import ast
-import inspect
-import re
-from typing import Dict, List, Any, Optional
+import html
+import io
+import os
+import string
+import sys
+from weakref import WeakKeyDictionary
+from typing import Dict, List, Optional
 
 
 class Component:
@@ -17,8 +21,15 @@ class Component:
     
     This class provides the foundation for creating React-like components in Python
     that can be transpiled to JavaScript.
+    
+    Subclasses may declare their state as an inner ``State`` class (typically a
+    ``@dataclass(slots=True)``) instead of assigning a dict to ``self.state``.
+    Its fields are then read and updated as attributes, e.g. ``self.state.count += 1``.
     """
     
+    # Optional state class, instantiated with no arguments for each component
+    State = None
+    
     def __init__(self, props=None):
         """
         Initialize the component with optional props.
@@ -27,9 +38,8 @@ class Component:
             props (dict, optional): Properties passed to the component
         """
         self.props = props or {}
-        self.state = {}
+        self.state = self.State() if self.State is not None else {}
         self.children = []
-        self.element = None
     
     def set_state(self, new_state):
         """
@@ -39,12 +49,26 @@ class Component:
             new_state (dict): State updates to apply
         """
         if isinstance(new_state, dict):
-            self.state.update(new_state)
+            if isinstance(self.state, dict):
+                self.state.update(new_state)
+            else:
+                for key, value in new_state.items():
+                    setattr(self.state, key, value)
         else:
             self.state = new_state
         # In a real implementation, this would trigger re-rendering
         self._trigger_update()
     
+    def mutate_state(self, mutator):
+        """
+        Update component state in place instead of merging a new dict.
+        
+        Args:
+            mutator (callable): Function that receives the state and modifies it
+        """
+        mutator(self.state)
+        self._trigger_update()
+    
     def _trigger_update(self):
         """
         Internal method to handle state updates.
@@ -98,6 +122,8 @@ class Element:
     providing a Python-based representation that can be transpiled to React.createElement calls.
     """
     
+    __slots__ = ('tag', 'props', 'children')
+    
     def __init__(self, tag, props=None, children=None):
         """
         Initialize a virtual DOM element.
@@ -107,7 +133,9 @@ class Element:
             props (dict, optional): Element properties/attributes
             children (list, optional): Child elements or text content
         """
-        self.tag = tag
+        # Tags from the helpers are interned literals already; this covers computed
+        # tags. Other tag types (e.g. component classes) are kept as given
+        self.tag = sys.intern(tag) if type(tag) is str else tag
         self.props = props or {}
         self.children = children or []
         
@@ -120,117 +148,403 @@ class Element:
         return f"Element(tag='{self.tag}', props={self.props}, children={len(self.children)})"
 
 
+class Text:
+    """
+    Text content assembled from several parts, used instead of an f-string.
+    
+    The parts are kept as given and only joined into a string when the text is
+    converted with str(), so building a render tree does not allocate the
+    formatted text. Transpiles to a JavaScript template literal.
+    """
+    
+    __slots__ = ('parts',)
+    
+    def __init__(self, *parts):
+        """
+        Initialize text content.
+        
+        Args:
+            *parts: Literal strings and values to concatenate
+        """
+        self.parts = parts
+    
+    def __str__(self):
+        return ''.join(map(str, self.parts))
+    
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"Text{self.parts!r}"
+
+
+# Element helpers by name: (HTML tag, docstring, options for _make_element_helper).
+# The helpers, the transpiler's tag mapping and FlatTree's tag ids all come from here
+_ELEMENT_HELPERS = {
+    'div': ('div', "Create a div element.", {'content': False}),
+    'h1': ('h1', "Create an h1 element.", {}),
+    'h2': ('h2', "Create an h2 element.", {}),
+    'h3': ('h3', "Create an h3 element.", {}),
+    'p': ('p', "Create a p (paragraph) element.", {}),
+    'span': ('span', "Create a span element.", {}),
+    'button': ('button', "Create a button element.", {}),
+    'input_': ('input', "Create an input element.", {'void': True}),
+    'input_field': ('input', "Create an input element (alias of input_).", {'void': True}),
+    'img': ('img', "Create an img element.", {'void': True}),
+    'a': ('a', "Create an anchor (a) element.", {}),
+    'ul': ('ul', "Create an unordered list (ul) element.", {'content': False}),
+    'ol': ('ol', "Create an ordered list (ol) element.", {'content': False}),
+    'li': ('li', "Create a list item (li) element.", {}),
+    'form': ('form', "Create a form element.", {'content': False}),
+    'label': ('label', "Create a label element.", {}),
+    'select': ('select', "Create a select element.", {'content': False}),
+    'option': ('option', "Create an option element.", {}),
+    'textarea': ('textarea', "Create a textarea element.", {}),
+    'br': ('br', "Create a br (line break) element.", {'void': True}),
+    'hr': ('hr', "Create an hr (horizontal rule) element.", {'void': True}),
+}
+
+# Tag ids used by FlatTree; other tags are numbered per tree, after these
+_TAG_NAMES = tuple(dict.fromkeys(tag for tag, _, _ in _ELEMENT_HELPERS.values()))
+_TAG_IDS = {tag: tag_id for tag_id, tag in enumerate(_TAG_NAMES)}
+
+# Tag id of text nodes in a FlatTree
+TEXT_NODE = -1
+
+# Elements that have no closing tag in HTML
+_VOID_TAGS = frozenset(tag for tag, _, options in _ELEMENT_HELPERS.values() if options.get('void'))
+
+
+class FlatTree:
+    """
+    A rendered element tree flattened into parallel lists in depth-first order.
+    
+    Each node is one index across ``tags`` (tag id, or TEXT_NODE), ``texts``
+    (text content, None for elements), ``props`` (index into ``prop_table``,
+    -1 for none) and ``child_counts``. Serializing walks these lists in a
+    single loop instead of recursing through Element objects.
+    
+    Tags that have no shared id are kept in the tree's own ``extra_tags``,
+    numbered from ``len(_TAG_NAMES)``, so trees never write to shared state.
+    """
+    
+    __slots__ = ('tags', 'texts', 'props', 'child_counts', 'prop_table', 'extra_tags')
+    
+    def __init__(self):
+        """Initialize an empty tree."""
+        self.tags = []
+        self.texts = []
+        self.props = []
+        self.child_counts = []
+        self.prop_table = []
+        self.extra_tags = []
+    
+    @classmethod
+    def from_element(cls, root):
+        """
+        Flatten an Element tree.
+        
+        Args:
+            root (Element): Root of the rendered tree
+            
+        Returns:
+            FlatTree: The flattened tree
+        """
+        tree = cls()
+        tags = tree.tags
+        texts = tree.texts
+        props = tree.props
+        child_counts = tree.child_counts
+        
+        # Props dicts shared between nodes (an Element placed in several spots) are stored once
+        prop_indices = {}
+        # Ids of this tree's extra_tags
+        extra_ids = {}
+        
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Element):
+                tag_id = _TAG_IDS.get(node.tag)
+                if tag_id is None:
+                    tag_id = extra_ids.get(node.tag)
+                    if tag_id is None:
+                        tag_id = extra_ids[node.tag] = len(_TAG_NAMES) + len(tree.extra_tags)
+                        tree.extra_tags.append(node.tag)
+                tags.append(tag_id)
+                texts.append(None)
+                if node.props:
+                    props_index = prop_indices.get(id(node.props))
+                    if props_index is None:
+                        props_index = prop_indices[id(node.props)] = len(tree.prop_table)
+                        tree.prop_table.append(node.props)
+                    props.append(props_index)
+                else:
+                    props.append(-1)
+                child_counts.append(len(node.children))
+                stack.extend(reversed(node.children))
+            else:
+                tags.append(TEXT_NODE)
+                texts.append('' if node is None else str(node))
+                props.append(-1)
+                child_counts.append(0)
+        
+        return tree
+    
+    def to_html(self):
+        """
+        Serialize the tree to an HTML string.
+        
+        Event handlers and other callable props are omitted, since they only
+        have a meaning in the browser.
+        
+        Returns:
+            str: HTML markup
+        """
+        out = []
+        tag_names = _TAG_NAMES + tuple(self.extra_tags)
+        # Open elements as [tag name, children still to be emitted]
+        open_elements = []
+        
+        for tag_id, text, props_index, child_count in zip(self.tags, self.texts, self.props, self.child_counts):
+            if open_elements:
+                open_elements[-1][1] -= 1
+            
+            if tag_id == TEXT_NODE:
+                out.append(html.escape(text))
+            else:
+                tag = tag_names[tag_id]
+                out.append('<' + tag)
+                if props_index >= 0:
+                    self._write_attributes(out, self.prop_table[props_index])
+                out.append('>')
+                if child_count:
+                    open_elements.append([tag, child_count])
+                elif tag not in _VOID_TAGS:
+                    out.append('</' + tag + '>')
+            
+            # Close every element whose last child was just emitted
+            while open_elements and open_elements[-1][1] == 0:
+                out.append('</' + open_elements.pop()[0] + '>')
+        
+        return ''.join(out)
+    
+    @staticmethod
+    def _write_attributes(out, props):
+        """Append HTML attributes for an element's props."""
+        for name, value in props.items():
+            if value is None or value is False or callable(value):
+                continue
+            if value is True:
+                out.append(' ' + name)
+            else:
+                out.append(f' {name}="{html.escape(str(value))}"')
+
+
 # Helper functions for creating common HTML elements
 # These provide JSX-like syntax in Python
 
-def div(*children, **props):
-    """Create a div element."""
-    return Element('div', props, list(children))
+def _make_element_helper(name, tag, doc, content=True, void=False):
+    """
+    Create a helper function that builds elements with a fixed tag.
+    
+    Args:
+        name (str): Name of the helper function
+        tag (str): HTML tag name of the created elements
+        doc (str): Docstring of the helper function
+        content (bool): Whether the first positional argument is optional content
+            that is skipped when None, as in h1("Title")
+        void (bool): Whether the element takes no children, as in br()
+        
+    Returns:
+        function: The element helper
+    """
+    if void:
+        def helper(**props):
+            return Element(tag, props, [])
+    elif content:
+        def helper(content=None, *children, **props):
+            all_children = [content] if content is not None else []
+            all_children.extend(children)
+            return Element(tag, props, all_children)
+    else:
+        def helper(*children, **props):
+            return Element(tag, props, list(children))
+    
+    helper.__name__ = helper.__qualname__ = name
+    helper.__doc__ = doc
+    return helper
 
-def h1(content=None, *children, **props):
-    """Create an h1 element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('h1', props, all_children)
 
-def h2(content=None, *children, **props):
-    """Create an h2 element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('h2', props, all_children)
+# Define div(), h1(), button(), ... as module-level functions
+globals().update(
+    (name, _make_element_helper(name, tag, doc, **options))
+    for name, (tag, doc, options) in _ELEMENT_HELPERS.items()
+)
 
-def h3(content=None, *children, **props):
-    """Create an h3 element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('h3', props, all_children)
+# HTML tag for each element helper the transpiler recognizes
+_HTML_ELEMENT_TO_TAG = {name: tag for name, (tag, _, _) in _ELEMENT_HELPERS.items()}
 
-def p(content=None, *children, **props):
-    """Create a p (paragraph) element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('p', props, all_children)
+# Lifecycle methods that are not transpiled
+_SKIP_LIFECYCLE = frozenset({'component_did_mount', 'component_will_unmount', 'should_component_update'})
 
-def span(content=None, *children, **props):
-    """Create a span element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('span', props, all_children)
+# Python event prop names and their React equivalents
+_EVENT_RENAMES = {
+    'onclick': 'onClick',
+    'onchange': 'onChange',
+    'onsubmit': 'onSubmit',
+}
 
-def button(content=None, *children, **props):
-    """Create a button element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('button', props, all_children)
+# Python identifiers the transpiler matches on, interned so comparisons
+# against parsed names usually succeed on the identity fast path
+_SELF = sys.intern('self')
+_STATE = sys.intern('state')
+_PROPS = sys.intern('props')
+_GET = sys.intern('get')
 
-def input_field(**props):
-    """Create an input element."""
-    return Element('input', props, [])
+# Shared JavaScript fragments emitted by the transpiler
+_JS_NULL = "null"
+_JS_STATE = "state"
 
-def img(**props):
-    """Create an img element."""
-    return Element('img', props, [])
+# Start of the React.createElement call for each tag, built once
+_CREATE_PREFIX = {tag: f"React.createElement('{tag}', " for tag in _HTML_ELEMENT_TO_TAG.values()}
+_CREATE_EMPTY = {tag: f"{prefix}{_JS_NULL})" for tag, prefix in _CREATE_PREFIX.items()}
 
-def a(content=None, *children, **props):
-    """Create an anchor (a) element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('a', props, all_children)
+class _RawJS(str):
+    """JavaScript source that _js_value emits as is instead of quoting it."""
+    
+    __slots__ = ()
 
-def ul(*children, **props):
-    """Create an unordered list (ul) element."""
-    return Element('ul', props, list(children))
 
-def ol(*children, **props):
-    """Create an ordered list (ol) element."""
-    return Element('ol', props, list(children))
+# Empty values made by dataclass default factories in State classes
+_STATE_FACTORIES = {'list': list, 'dict': dict, 'tuple': tuple}
 
-def li(content=None, *children, **props):
-    """Create a list item (li) element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('li', props, all_children)
+# JavaScript formatting of Python values by exact type, so bool is not treated as int
+_JS_VALUE_FORMATTERS = {
+    _RawJS: str,
+    str: lambda value: f'"{value}"',
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: _JS_NULL,
+    list: lambda value: "[" + ", ".join(map(_js_value, value)) + "]",
+    tuple: lambda value: "[" + ", ".join(map(_js_value, value)) + "]",
+    dict: lambda value: "{" + ", ".join(f"{key}: {_js_value(item)}" for key, item in value.items()) + "}",
+}
 
-def form(*children, **props):
-    """Create a form element."""
-    return Element('form', props, list(children))
 
-def label(content=None, *children, **props):
-    """Create a label element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('label', props, all_children)
+def _js_value(value):
+    """Format a Python literal value as JavaScript; numbers use str()."""
+    return _JS_VALUE_FORMATTERS.get(type(value), str)(value)
 
-def select(*children, **props):
-    """Create a select element."""
-    return Element('select', props, list(children))
 
-def option(content=None, *children, **props):
-    """Create an option element."""
-    all_children = [content] if content is not None else []
-    all_children.extend(children)
-    return Element('option', props, all_children)
+# JavaScript symbols for the supported arithmetic operators
+_BINOP_SYMBOLS = {ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/'}
 
-def textarea(content=None, **props):
-    """Create a textarea element."""
-    children = [content] if content is not None else []
-    return Element('textarea', props, children)
+# Digest of this module's file, computed on first use by _transpiler_digest;
+# empty if the file cannot be read
+_TRANSPILER_DIGEST = None
 
-def br(**props):
-    """Create a br (line break) element."""
-    return Element('br', props, [])
 
-def hr(**props):
-    """Create an hr (horizontal rule) element."""
-    return Element('hr', props, [])
+def _transpiler_digest():
+    """
+    Return a digest of the transpiler's own code.
+    
+    It is part of every cache key, so on-disk entries written by a different
+    version of the transpiler are never served.
+    
+    Returns:
+        bytes: The digest, or b'' if the module file cannot be read
+    """
+    global _TRANSPILER_DIGEST
+    if _TRANSPILER_DIGEST is None:
+        import hashlib
+        try:
+            with open(__file__, 'rb') as f:
+                _TRANSPILER_DIGEST = hashlib.blake2b(f.read(), digest_size=16).digest()
+        except (OSError, NameError):
+            _TRANSPILER_DIGEST = b''
+    return _TRANSPILER_DIGEST
+
+# Stylesheet of the demo page, minified; one rule per source line
+_CSS_MIN = (
+    "body{font-family:Arial,sans-serif;max-width:800px;margin:0 auto;padding:20px;background-color:#f5f5f5}"
+    ".component-container{background:white;padding:20px;margin:20px 0;border-radius:8px;box-shadow:0 2px 4px rgba(0,0,0,0.1)}"
+    "button{background-color:#007bff;color:white;border:none;padding:10px 20px;border-radius:4px;cursor:pointer;font-size:16px;margin:5px}"
+    "button:hover{background-color:#0056b3}"
+    "h1,h2,h3{color:#333}"
+    ".counter{text-align:center;padding:20px}"
+    ".counter h1{font-size:2em;margin-bottom:20px}"
+)
+
+# Standalone demo page; its {fields} are filled in by _iter_html_page
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <script src="https://unpkg.com/react@17/umd/react.development.js"></script>
+    <script src="https://unpkg.com/react-dom@17/umd/react-dom.development.js"></script>
+    <style>{css}</style>
+</head>
+<body>
+    <h1>{title}</h1>
+    <p>Components generated by PyReact - Python to JavaScript React Transpiler</p>
+    
+{container_divs}
+
+    <script>
+{js_code}
+
+    // Render components
+{render_calls}
+    </script>
+</body>
+</html>"""
+
+# The page template as (literal text, field name) pairs, so a page can be
+# produced piece by piece; the field name is None after the last literal
+_HTML_TEMPLATE_PARTS = tuple(
+    (literal, field) for literal, field, _, _ in string.Formatter().parse(_HTML_TEMPLATE)
+)
+
+# Fixed parts of the per-component render call and container div
+_RENDER_CALL_PREFIX = "    ReactDOM.render(React.createElement("
+_RENDER_CALL_MIDDLE = "), document.getElementById('"
+_RENDER_CALL_SUFFIX = "-root'));"
+_CONTAINER_PREFIX = '    <div id="'
+_CONTAINER_SUFFIX = '-root"></div>'
+
+# Parsed class definitions by component class; weak keys so reloaded or
+# discarded classes are not kept alive
+_CLASS_DEF_CACHE = WeakKeyDictionary()
 
 
 class PyReactTranspiler:
     """Main transpiler class that converts Python components to JavaScript React code."""
     
-    def __init__(self):
+    # Transpiled JavaScript shared by all instances, keyed by a hash of the class source
+    _cache: Dict[bytes, str] = {}
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the transpiler.
+        
+        Args:
+            cache_dir (str, optional): Directory used to persist transpiled components
+                between runs. Only the in-memory cache is used when omitted.
+        """
         self.components = {}
-        self.js_output = []
+        # Class each entry in self.components was transpiled from
+        self._component_classes = {}
+        self.local_functions = {}
+        self.state_params = set()
+        self._expr_cache = {}
+        # Complete JavaScript bundle as (components snapshot, bundle), and the
+        # last HTML page as ((components, title), bundle, page); both are checked
+        # against the current state, since self.components may be written directly
+        self._js_cache = None
+        self._page_cache = None
+        # (container div, render call) for each stored component name
+        self._fragments = {}
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
         
     def transpile_component(self, component_class) -> str:
         """
@@ -242,83 +556,250 @@ class PyReactTranspiler:
         Returns:
             str: The generated JavaScript code
         """
-        # Get the source code of the class
-        source_code = inspect.getsource(component_class)
+        name = component_class.__name__
         
-        # Parse the source code into an AST
-        tree = ast.parse(source_code)
+        # Nothing to do if this exact class was already transpiled here
+        if self._component_classes.get(name) is component_class:
+            return self.components[name]
         
-        # Find the class definition
-        class_def = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == component_class.__name__:
-                class_def = node
-                break
-        
-        if not class_def:
-            raise ValueError(f"Could not find class definition for {component_class.__name__}")
+        # Classes decorated with @component were already transpiled at definition time
+        js_code = vars(component_class).get('__pyreact_js__')
+        if js_code is not None:
+            self._store_component(component_class, js_code)
+            return js_code
         
-        # Extract component information
-        component_info = self._analyze_component_class(class_def)
+        # Get the source code of the class; inspect is only needed for classes
+        # that were not transpiled by @component, so it is imported here
+        import inspect
+        source_code = inspect.getsource(component_class)
         
-        # Generate JavaScript code
-        js_code = self._generate_js_component(component_info)
+        # Reuse a previous transpilation of the exact same source
+        cache_key = self._cache_key(component_class, source_code)
+        js_code = self._cache_lookup(cache_key)
+        if js_code is None:
+            class_def = self._parse_component_class(component_class, source_code)
+            js_code = self._transpile_class_def(class_def)
+            self._cache_store(cache_key, js_code)
         
         # Store the component for later use
-        self.components[component_class.__name__] = js_code
+        self._store_component(component_class, js_code)
         
         return js_code
     
-    def _analyze_component_class(self, class_def):
+    def _store_component(self, component_class, js_code):
         """
-        Analyze a Python class AST node to extract component information.
+        Record the JavaScript for a transpiled component class.
+        
+        Args:
+            component_class: The Python class that was transpiled
+            js_code (str): The generated JavaScript code
+        """
+        self.components[component_class.__name__] = js_code
+        self._component_classes[component_class.__name__] = component_class
+        self._fragments[component_class.__name__] = self._page_fragments(component_class.__name__)
+    
+    def _parse_component_class(self, component_class, source_code=None):
+        """
+        Get the AST class definition of a component class.
+        
+        The parsed definition is stored on the class as ``__pyreact_ast__`` the
+        first time (``@component`` does this at definition time), so the source
+        is only read and parsed once per class.
+        
+        Args:
+            component_class: The Python class to parse
+            source_code (str, optional): Source code of the class, if already read
+            
+        Returns:
+            ast.ClassDef: The class definition
+        """
+        class_def = vars(component_class).get('__pyreact_ast__')
+        if class_def is None:
+            class_def = _CLASS_DEF_CACHE.get(component_class)
+        if class_def is not None:
+            return class_def
+        
+        import inspect
+        import textwrap
+        
+        if source_code is None:
+            source_code = inspect.getsource(component_class)
+        
+        # Parse the source code into an AST; dedent so nested classes parse too
+        tree = ast.parse(textwrap.dedent(source_code))
+        
+        # Find the class definition
+        class_def = self._find_class_def(tree, component_class.__name__)
+        
+        if not class_def:
+            raise ValueError(f"Could not find class definition for {component_class.__name__}")
+        
+        # Keep the definition on the class itself so the next lookup is a plain
+        # attribute read; classes that refuse new attributes use the weak cache
+        try:
+            component_class.__pyreact_ast__ = class_def
+        except (TypeError, AttributeError):
+            _CLASS_DEF_CACHE[component_class] = class_def
+        return class_def
+    
+    def _transpile_class_def(self, class_def):
+        """
+        Transpile an AST class definition to JavaScript React code.
         
         Args:
             class_def: AST ClassDef node
             
         Returns:
-            dict: Component information including methods, state, etc.
+            str: The generated JavaScript code
         """
-        component_info = {
-            'name': class_def.name,
-            'methods': {},
-            'init_method': None,
-            'render_method': None,
-            'initial_state': {},
-        }
+        # Expression results are only reused within one class definition,
+        # whose nodes stay alive (and keep their ids) while it is transpiled
+        self._expr_cache.clear()
+        
+        # Methods are collected by name in one pass over the class body, so a
+        # redefined method keeps only its last definition, as in Python; the
+        # output is written once everything has been collected
+        initial_state = {}
+        render_method = None
+        methods = {}
         
-        # Analyze each method in the class
         for node in class_def.body:
             if isinstance(node, ast.FunctionDef):
-                method_info = self._analyze_method(node)
-                component_info['methods'][node.name] = method_info
-                
-                # Special handling for specific methods
                 if node.name == '__init__':
-                    component_info['init_method'] = method_info
                     # Extract initial state from __init__
-                    component_info['initial_state'] = self._extract_initial_state(node)
+                    initial_state = self._extract_initial_state(node)
                 elif node.name == 'render':
-                    component_info['render_method'] = method_info
+                    render_method = node
+                else:
+                    methods[node.name] = node
+            elif isinstance(node, ast.ClassDef) and node.name == 'State':
+                # Attribute-style state declared as an inner class
+                initial_state.update(self._extract_state_class(node))
+        
+        out = io.StringIO()
+        out.write(f"function {class_def.name}(props) {{\n")
+        
+        # Add state hook if there's initial state
+        if initial_state:
+            state_obj = self._dict_to_js_object(initial_state)
+            out.write(f"  const [state, setState] = React.useState({state_obj});\n\n")
         
-        return component_info
+        for method_node in methods.values():
+            self._transpile_method_to_js(method_node, out)
+        
+        # Add render method
+        if render_method:
+            out.write("  return ")
+            self._transpile_render_method(render_method, out)
+            out.write(";\n")
+        else:
+            out.write("  return null;\n")
+        
+        out.write("}")
+        
+        # Node ids are only meaningful while this tree is being walked
+        self._expr_cache.clear()
+        
+        return out.getvalue()
     
-    def _analyze_method(self, method_node):
+    def _find_class_def(self, tree, class_name):
         """
-        Analyze a Python method AST node.
+        Find a top-level class definition by name in a parsed module.
+        
+        The source from inspect.getsource starts at the class itself, so only
+        the top-level statements need to be checked, and usually the first one
+        is the class.
         
         Args:
-            method_node: AST FunctionDef node
+            tree: AST Module node
+            class_name (str): Name of the class to find
+            
+        Returns:
+            ast.ClassDef: The matching class definition, or None if not found
+        """
+        body = tree.body
+        if body and isinstance(body[0], ast.ClassDef) and body[0].name == class_name:
+            return body[0]
+        
+        return next((node for node in body
+                     if isinstance(node, ast.ClassDef) and node.name == class_name), None)
+    
+    def _cache_key(self, component_class, source_code):
+        """
+        Compute the content-addressed cache key for a component class.
+        
+        Args:
+            component_class: The Python class being transpiled
+            source_code (str): Source code of the class
+            
+        Returns:
+            bytes: Digest identifying this class source and transpiler version
+        """
+        import hashlib
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_transpiler_digest())
+        digest.update(f":{component_class.__qualname__}:".encode('utf-8'))
+        digest.update(source_code.encode('utf-8'))
+        return digest.digest()
+    
+    def _cache_path(self, cache_key):
+        """Return the on-disk location for a cache key."""
+        return os.path.join(self.cache_dir, cache_key.hex() + '.js')
+    
+    def _disk_cache_enabled(self):
+        """Whether entries are read from and written to cache_dir."""
+        # Without a transpiler digest, stale entries could not be told apart
+        return bool(self.cache_dir) and bool(_transpiler_digest())
+    
+    def _cache_lookup(self, cache_key):
+        """
+        Look up previously transpiled JavaScript.
+        
+        Args:
+            cache_key (bytes): Key from _cache_key
             
         Returns:
-            dict: Method information
+            str: Cached JavaScript code, or None on a miss
+        """
+        js_code = self._cache.get(cache_key)
+        if js_code is None and self._disk_cache_enabled():
+            try:
+                with open(self._cache_path(cache_key), 'r', encoding='utf-8') as f:
+                    js_code = f.read()
+            except OSError:
+                return None
+            self._cache[cache_key] = js_code
+        return js_code
+    
+    def _cache_store(self, cache_key, js_code):
         """
-        return {
-            'name': method_node.name,
-            'args': [arg.arg for arg in method_node.args.args],
-            'body': method_node.body,
-            'ast_node': method_node
-        }
+        Remember transpiled JavaScript in memory and, if configured, on disk.
+        
+        Args:
+            cache_key (bytes): Key from _cache_key
+            js_code (str): Generated JavaScript code
+        """
+        self._cache[cache_key] = js_code
+        if self._disk_cache_enabled():
+            import tempfile
+            
+            # The disk cache is best-effort; failing to write it is not an error.
+            # Entries are written to a temporary file and renamed into place, so
+            # readers never see a partially written entry
+            temp_path = None
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+                with open(fd, 'w', encoding='utf-8') as f:
+                    f.write(js_code)
+                os.replace(temp_path, self._cache_path(cache_key))
+            except OSError:
+                if temp_path is not None:
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
     
     def _extract_initial_state(self, init_node):
         """
@@ -335,95 +816,102 @@ class PyReactTranspiler:
         for stmt in init_node.body:
             if isinstance(stmt, ast.Assign):
                 for target in stmt.targets:
-                    if (isinstance(target, ast.Attribute) and 
-                        isinstance(target.value, ast.Name) and 
-                        target.value.id == 'self' and 
-                        target.attr == 'state'):
+                    if self._is_self_attr(target, _STATE):
                         # Found self.state assignment
                         if isinstance(stmt.value, ast.Dict):
-                            # Extract dictionary literal
+                            # Most state dicts are pure literals and evaluate in one call
+                            try:
+                                initial_state.update(ast.literal_eval(stmt.value))
+                                continue
+                            except (ValueError, TypeError):
+                                pass
+                            
+                            # Otherwise extract the dictionary literal key by key
                             for key, value in zip(stmt.value.keys, stmt.value.values):
                                 if isinstance(key, ast.Constant):
-                                    if isinstance(value, ast.Constant):
-                                        # Handle basic constants properly
-                                        if isinstance(value.value, str):
-                                            initial_state[key.value] = value.value
-                                        else:
-                                            initial_state[key.value] = value.value
-                                    else:
-                                        initial_state[key.value] = self._ast_to_js_value(value)
+                                    initial_state[key.value] = self._state_default(value)
         
         return initial_state
     
-    def _ast_to_js_value(self, node):
+    def _extract_state_class(self, state_class_def):
         """
-        Convert AST node to JavaScript value representation.
+        Extract initial state from the field defaults of an inner State class.
         
         Args:
-            node: AST node
+            state_class_def: AST ClassDef node for State
             
         Returns:
-            str: JavaScript representation
+            dict: Initial state values
         """
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, str):
-                return f'"{node.value}"'
-            else:
-                return str(node.value).lower() if isinstance(node.value, bool) else str(node.value)
-        elif isinstance(node, ast.List):
-            elements = [self._ast_to_js_value(el) for el in node.elts]
-            return f'[{", ".join(elements)}]'
-        elif isinstance(node, ast.Dict):
-            pairs = []
-            for key, value in zip(node.keys, node.values):
-                key_str = self._ast_to_js_value(key)
-                value_str = self._ast_to_js_value(value)
-                pairs.append(f'{key_str}: {value_str}')
-            return f'{{{", ".join(pairs)}}}'
-        else:
-            return 'null'
+        initial_state = {}
+        
+        for stmt in state_class_def.body:
+            # Fields look like `count: int = 0`; fields without a default are skipped
+            if (isinstance(stmt, ast.AnnAssign) and
+                isinstance(stmt.target, ast.Name) and
+                stmt.value is not None):
+                initial_state[stmt.target.id] = self._state_default(stmt.value)
+        
+        return initial_state
     
-    def _generate_js_component(self, component_info):
+    def _state_default(self, node):
         """
-        Generate JavaScript React component from component information.
+        Evaluate the initial value of a state entry.
+        
+        Literals become Python values. Dataclass ``field(default=...)`` and
+        ``field(default_factory=list)`` are unwrapped. Anything else is
+        transpiled to JavaScript and marked so it is not quoted again.
         
         Args:
-            component_info: Component analysis results
+            node: AST node of the value
             
         Returns:
-            str: JavaScript component code
+            The Python value, or _RawJS for other expressions
+        """
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError):
+            pass
+        
+        if (type(node) is ast.Call and type(node.func) is ast.Name and
+            node.func.id == 'field'):
+            for keyword in node.keywords:
+                if keyword.arg == 'default':
+                    return self._state_default(keyword.value)
+                if (keyword.arg == 'default_factory' and type(keyword.value) is ast.Name and
+                    keyword.value.id in _STATE_FACTORIES):
+                    return _STATE_FACTORIES[keyword.value.id]()
+        
+        return _RawJS(self._ast_to_js_value(node))
+    
+    def _ast_to_js_value(self, node):
         """
-        component_name = component_info['name']
-        initial_state = component_info['initial_state']
-        
-        # Start building the JavaScript function
-        js_lines = []
-        js_lines.append(f"function {component_name}(props) {{")
-        
-        # Add state hook if there's initial state
-        if initial_state:
-            state_obj = self._dict_to_js_object(initial_state)
-            js_lines.append(f"  const [state, setState] = React.useState({state_obj});")
-            js_lines.append("")
-        
-        # Add component methods (excluding __init__ and render)
-        for method_name, method_info in component_info['methods'].items():
-            if method_name not in ['__init__', 'render']:
-                method_js = self._transpile_method_to_js(method_info)
-                if method_js:
-                    js_lines.append(f"  {method_js}")
-                    js_lines.append("")
-        
-        # Add render method
-        if component_info['render_method']:
-            render_js = self._transpile_render_method(component_info['render_method'])
-            js_lines.append(f"  return {render_js};")
-        else:
-            js_lines.append("  return null;")
-        
-        js_lines.append("}")
+        Convert AST node to JavaScript value representation.
         
-        return "\n".join(js_lines)
+        Args:
+            node: AST node
+            
+        Returns:
+            str: JavaScript representation
+        """
+        handler = self._VALUE_DISPATCH.get(type(node))
+        if handler is None:
+            return 'null'
+        return handler(self, node)
+    
+    def _list_to_js_value(self, list_node):
+        """Convert an AST List literal to a JavaScript array."""
+        elements = [self._ast_to_js_value(el) for el in list_node.elts]
+        return f'[{", ".join(elements)}]'
+    
+    def _dict_to_js_value(self, dict_node):
+        """Convert an AST Dict literal to a JavaScript object."""
+        pairs = []
+        for key, value in zip(dict_node.keys, dict_node.values):
+            key_str = self._ast_to_js_value(key)
+            value_str = self._ast_to_js_value(value)
+            pairs.append(f'{key_str}: {value_str}')
+        return f'{{{", ".join(pairs)}}}'
     
     def _dict_to_js_object(self, python_dict):
         """
@@ -438,81 +926,74 @@ class PyReactTranspiler:
         if not python_dict:
             return "{}"
         
-        pairs = []
-        for key, value in python_dict.items():
-            if isinstance(value, str):
-                pairs.append(f'{key}: "{value}"')
-            elif isinstance(value, bool):
-                pairs.append(f'{key}: {str(value).lower()}')
-            else:
-                pairs.append(f'{key}: {value}')
-        
-        return "{" + ", ".join(pairs) + "}"
+        return "{" + ", ".join(f"{key}: {_js_value(value)}" for key, value in python_dict.items()) + "}"
     
     def generate_complete_js(self) -> str:
         """
         Generate complete JavaScript code with all transpiled components.
         
+        The bundle is reused as long as self.components holds the same entries.
+        
         Returns:
             str: Complete JavaScript code ready for execution
         """
-        if not self.components:
-            return "// No components to transpile"
-        
-        js_parts = []
-        js_parts.append("// PyReact - Transpiled Components")
-        js_parts.append("")
+        # Comparing the snapshot is cheap next to joining, since unchanged
+        # entries are the same string objects
+        snapshot = tuple(self.components.items())
+        if self._js_cache is not None and self._js_cache[0] == snapshot:
+            return self._js_cache[1]
         
-        for component_name, component_code in self.components.items():
-            js_parts.append(component_code)
-            js_parts.append("")
+        if not snapshot:
+            return "// No components to transpile"
         
-        return "\n".join(js_parts)
+        # Components are emitted in registration order, separated by blank lines
+        body = "\n\n".join(js_code for _, js_code in snapshot)
+        js_code = "// PyReact - Transpiled Components\n\n" + body + "\n"
+        self._js_cache = (snapshot, js_code)
+        return js_code
     
-    def _transpile_method_to_js(self, method_info):
+    def _transpile_method_to_js(self, method_node, out):
         """
         Transpile a Python method to JavaScript function.
         
         Args:
-            method_info: Method information from analysis
-            
-        Returns:
-            str: JavaScript function code
+            method_node: AST FunctionDef node
+            out: Text buffer the JavaScript function is written to
         """
-        method_name = method_info['name']
-        method_body = method_info['body']
+        method_name = method_node.name
+        method_body = method_node.body
         
         # Skip lifecycle methods that don't need transpilation
-        if method_name in ['component_did_mount', 'component_will_unmount', 'should_component_update']:
-            return None
+        if method_name in _SKIP_LIFECYCLE:
+            return
+        
+        # Track nested helper functions, e.g. state mutators
+        self.local_functions = {}
         
-        js_lines = []
-        js_lines.append(f"const {method_name} = () => {{")
+        out.write(f"  const {method_name} = () => {{\n")
         
         # Transpile method body
         for stmt in method_body:
             js_stmt = self._transpile_statement(stmt)
             if js_stmt:
-                js_lines.append(f"    {js_stmt}")
-        
-        js_lines.append("  };")
+                out.write(f"    {js_stmt}\n")
         
-        return "\n".join(js_lines)
+        out.write("  };\n\n")
     
-    def _transpile_render_method(self, render_method_info):
+    def _transpile_render_method(self, render_method_node, out):
         """
         Transpile the render method to JavaScript JSX-like code.
         
         Args:
-            render_method_info: Render method information
-            
-        Returns:
-            str: JavaScript render code
+            render_method_node: AST FunctionDef node for render
+            out: Text buffer the JavaScript render expression is written to
         """
-        render_body = render_method_info['body']
+        render_body = render_method_node.body
         
-        # Track local variables for proper transpilation
-        self.local_variables = {}
+        # Most render methods are a single return with no locals to set up
+        if len(render_body) == 1 and isinstance(render_body[0], ast.Return):
+            self._transpile_element_expression(render_body[0].value, out)
+            return
         
         # Process all statements to handle local variables
         js_statements = []
@@ -531,13 +1012,13 @@ class PyReactTranspiler:
         if return_statement:
             if js_statements:
                 # If we have local variables, wrap in an IIFE
-                statements_str = '; '.join(js_statements)
-                return_expr = self._transpile_element_expression(return_statement.value)
-                return f"(() => {{ {statements_str}; return {return_expr}; }})()"
+                out.write(f"(() => {{ {'; '.join(js_statements)}; return ")
+                self._transpile_element_expression(return_statement.value, out)
+                out.write("; })()")
             else:
-                return self._transpile_element_expression(return_statement.value)
-        
-        return "null"
+                self._transpile_element_expression(return_statement.value, out)
+        else:
+            out.write(_JS_NULL)
     
     def _transpile_render_assignment(self, assign_node):
         """
@@ -557,9 +1038,6 @@ class PyReactTranspiler:
                 # Transpile the assignment value
                 value_js = self._transpile_expression(assign_node.value)
                 
-                # Track this local variable
-                self.local_variables[var_name] = value_js
-                
                 return f"const {var_name} = {value_js}"
         
         return None
@@ -574,16 +1052,45 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript statement
         """
-        if isinstance(stmt, ast.Expr):
-            if isinstance(stmt.value, ast.Call):
-                return self._transpile_method_call(stmt.value)
-        elif isinstance(stmt, ast.Assign):
-            return self._transpile_assignment(stmt)
-        elif isinstance(stmt, ast.Return):
-            return f"return {self._transpile_expression(stmt.value)};"
-        
+        handler = self._STATEMENT_DISPATCH.get(type(stmt))
+        if handler is None:
+            return ""
+        return handler(self, stmt)
+    
+    def _transpile_expression_statement(self, expr_node):
+        """Transpile a bare expression statement; only method calls are kept."""
+        if isinstance(expr_node.value, ast.Call):
+            return self._transpile_method_call(expr_node.value)
+        return ""
+    
+    def _transpile_return(self, return_node):
+        """Transpile a return statement."""
+        return f"return {self._transpile_expression(return_node.value)};"
+    
+    def _transpile_local_function(self, func_node):
+        """Record a nested function; it is emitted where it is used, e.g. by mutate_state."""
+        self.local_functions[func_node.name] = func_node
         return ""
     
+    @staticmethod
+    def _is_self_attr(node: ast.AST, attr_name: Optional[str] = None) -> bool:
+        """
+        Check whether a node is an attribute of self, like self.state.
+        
+        Uses exact type checks, which are cheaper than isinstance for AST nodes.
+        
+        Args:
+            node: AST node to check
+            attr_name (str, optional): Required attribute name; any name matches if omitted
+            
+        Returns:
+            bool: True if node is self.<attr_name>
+        """
+        return (type(node) is ast.Attribute and
+                type(node.value) is ast.Name and
+                node.value.id == _SELF and
+                (attr_name is None or node.attr == attr_name))
+    
     def _transpile_method_call(self, call_node):
         """
         Transpile a method call, especially set_state calls.
@@ -594,18 +1101,68 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript method call
         """
-        if (isinstance(call_node.func, ast.Attribute) and
-            isinstance(call_node.func.value, ast.Name) and
-            call_node.func.value.id == 'self' and
-            call_node.func.attr == 'set_state'):
+        if self._is_self_attr(call_node.func, 'set_state'):
             
             # Convert self.set_state to setState
             if call_node.args:
                 state_arg = self._transpile_expression(call_node.args[0])
                 return f"setState(prevState => ({{...prevState, ...{state_arg}}}));"
         
+        if self._is_self_attr(call_node.func, 'mutate_state'):
+            
+            # Convert self.mutate_state(fn) to a setState updater that edits a copy
+            if call_node.args and isinstance(call_node.args[0], ast.Name):
+                mutator = self.local_functions.get(call_node.args[0].id)
+                if mutator:
+                    return self._transpile_state_mutator(mutator)
+        
         return ""
     
+    def _transpile_state_mutator(self, func_node):
+        """
+        Transpile a mutate_state function to a setState updater.
+        
+        Args:
+            func_node: AST FunctionDef node taking the state as its only argument
+            
+        Returns:
+            str: JavaScript setState call
+        """
+        if len(func_node.args.args) != 1:
+            return ""
+        
+        param = func_node.args.args[0].arg
+        self.state_params.add(param)
+        try:
+            body = [self._transpile_statement(stmt) for stmt in func_node.body]
+        finally:
+            self.state_params.discard(param)
+        
+        statements = " ".join(stmt for stmt in body if stmt)
+        return f"setState(prevState => {{ const {param} = {{...prevState}}; {statements} return {param}; }});"
+    
+    def _state_param_target(self, target):
+        """
+        Return the JavaScript target if target is a field of a mutator's state argument.
+        
+        Args:
+            target: AST node for an assignment target
+            
+        Returns:
+            str: JavaScript property access like s.clicks, otherwise None
+        """
+        if (isinstance(target, ast.Subscript) and
+            isinstance(target.value, ast.Name) and
+            target.value.id in self.state_params and
+            isinstance(target.slice, ast.Constant)):
+            return f"{target.value.id}.{target.slice.value}"
+        if (isinstance(target, ast.Attribute) and
+            isinstance(target.value, ast.Name) and
+            target.value.id in self.state_params):
+            return f"{target.value.id}.{target.attr}"
+        
+        return None
+    
     def _transpile_assignment(self, assign_node):
         """
         Transpile assignment statements.
@@ -616,10 +1173,63 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript assignment
         """
-        # For now, skip most assignments as they're handled differently in React
+        # Assigning a state field becomes a setState call
+        if len(assign_node.targets) == 1:
+            state_key = self._state_attribute_key(assign_node.targets[0])
+            if state_key:
+                value_js = self._transpile_expression(assign_node.value)
+                return f"setState(prevState => ({{...prevState, {state_key}: {value_js}}}));"
+            
+            # Inside a mutate_state function fields are assigned directly
+            target_js = self._state_param_target(assign_node.targets[0])
+            if target_js:
+                return f"{target_js} = {self._transpile_expression(assign_node.value)};"
+        
+        # Skip other assignments as they're handled differently in React
+        return ""
+    
+    def _transpile_aug_assignment(self, aug_assign_node):
+        """
+        Transpile augmented assignments like self.state.count += 1.
+        
+        Args:
+            aug_assign_node: AST AugAssign node
+            
+        Returns:
+            str: JavaScript setState call
+        """
+        state_key = self._state_attribute_key(aug_assign_node.target)
+        if state_key:
+            value_js = self._transpile_binary_operation(
+                ast.BinOp(left=aug_assign_node.target, op=aug_assign_node.op, right=aug_assign_node.value)
+            )
+            return f"setState(prevState => ({{...prevState, {state_key}: {value_js}}}));"
+        
+        target_js = self._state_param_target(aug_assign_node.target)
+        if target_js:
+            operator = _BINOP_SYMBOLS.get(type(aug_assign_node.op))
+            if operator:
+                value_js = self._transpile_expression(aug_assign_node.value)
+                return f"{target_js} {operator}= {value_js};"
+        
         return ""
     
-    def _transpile_expression(self, expr):
+    def _state_attribute_key(self, target):
+        """
+        Return the field name if target is an attribute-style state field.
+        
+        Args:
+            target: AST node for an assignment target
+            
+        Returns:
+            str: Field name for targets like self.state.count, otherwise None
+        """
+        if type(target) is ast.Attribute and self._is_self_attr(target.value, _STATE):
+            return target.attr
+        
+        return None
+    
+    def _transpile_expression(self, expr: ast.expr) -> str:
         """
         Transpile a Python expression to JavaScript.
         
@@ -629,99 +1239,89 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript expression
         """
-        if isinstance(expr, ast.Dict):
-            return self._transpile_dict_literal(expr)
-        elif isinstance(expr, ast.Constant):
-            if isinstance(expr.value, str):
-                return f'"{expr.value}"'
-            else:
-                return str(expr.value).lower() if isinstance(expr.value, bool) else str(expr.value)
-        elif isinstance(expr, ast.Name):
-            return expr.id
-        elif isinstance(expr, ast.Attribute):
-            return self._transpile_attribute_access(expr)
-        elif isinstance(expr, ast.BinOp):
-            return self._transpile_binary_operation(expr)
-        elif isinstance(expr, ast.JoinedStr):
-            return self._transpile_f_string(expr)
-        elif isinstance(expr, ast.Call):
-            return self._transpile_function_call(expr)
-        elif isinstance(expr, ast.Subscript):
-            return self._transpile_subscript(expr)
-        else:
-            return "null"
+        # Subtrees reached more than once are only transpiled the first time
+        key = id(expr)
+        js_code = self._expr_cache.get(key)
+        if js_code is not None:
+            return js_code
+        
+        handler = self._EXPRESSION_DISPATCH.get(type(expr))
+        js_code = _JS_NULL if handler is None else handler(self, expr)
+        self._expr_cache[key] = js_code
+        return js_code
+    
+    def _transpile_constant(self, constant_node):
+        """Transpile a constant to a JavaScript literal."""
+        return _js_value(constant_node.value)
+    
+    def _transpile_name(self, name_node):
+        """Transpile a variable name."""
+        return name_node.id
     
-    def _transpile_element_expression(self, expr):
+    def _transpile_element_expression(self, expr, out):
         """
         Transpile element expressions (like div(), h1(), etc.) to React.createElement.
         
         Args:
             expr: AST expression node
-            
-        Returns:
-            str: React.createElement call
+            out: Text buffer the JavaScript expression is written to
         """
         if isinstance(expr, ast.Call):
-            return self._transpile_element_call(expr)
+            if isinstance(expr.func, ast.Name) and expr.func.id == 'Text':
+                out.write(self._transpile_text(expr))
+            else:
+                self._transpile_element_call(expr, out)
         else:
-            return self._transpile_expression(expr)
+            out.write(self._transpile_expression(expr))
     
-    def _transpile_element_call(self, call_node):
+    def _transpile_element_call(self, call_node, out):
         """
         Transpile element function calls to React.createElement.
         
         Args:
             call_node: AST Call node
-            
-        Returns:
-            str: React.createElement call
+            out: Text buffer the React.createElement call is written to
         """
         if isinstance(call_node.func, ast.Name):
-            element_name = call_node.func.id
-            
-            # Handle common HTML elements
-            html_elements = ['div', 'h1', 'h2', 'h3', 'p', 'span', 'button', 'input_field', 'a', 'ul', 'ol', 'li', 'form', 'label', 'select', 'option', 'textarea', 'br', 'hr', 'img']
+            # Handle common HTML elements; this also maps input_field to input
+            tag_name = _HTML_ELEMENT_TO_TAG.get(call_node.func.id)
             
-            if element_name in html_elements:
-                # Convert input_field to input
-                tag_name = 'input' if element_name == 'input_field' else element_name
+            if tag_name is not None:
+                # Elements without props or children, like br(), need no further work
+                if not call_node.args and not call_node.keywords:
+                    out.write(_CREATE_EMPTY[tag_name])
+                    return
                 
-                # Extract props and children
+                # Extract props
                 props = {}
-                children = []
-                
-                # Process arguments and keyword arguments
-                for arg in call_node.args:
-                    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                        children.append(f'"{arg.value}"')
-                    else:
-                        children.append(self._transpile_element_expression(arg))
                 
                 # Process keyword arguments as props
                 for keyword in call_node.keywords:
-                    prop_name = keyword.arg
-                    prop_value = self._transpile_prop_value(keyword.value)
-                    
                     # Convert onclick to onClick, etc.
-                    if prop_name == 'onclick':
-                        prop_name = 'onClick'
-                    elif prop_name == 'onchange':
-                        prop_name = 'onChange'
-                    elif prop_name == 'onsubmit':
-                        prop_name = 'onSubmit'
-                    
-                    props[prop_name] = prop_value
+                    prop_name = _EVENT_RENAMES.get(keyword.arg, keyword.arg)
+                    props[prop_name] = self._transpile_prop_value(keyword.value)
                 
                 # Build React.createElement call
-                props_str = self._build_props_object(props) if props else "null"
+                props_str = self._build_props_object(props) if props else _JS_NULL
+                out.write(_CREATE_PREFIX[tag_name])
+                out.write(props_str)
                 
-                if children:
-                    children_str = f"[{', '.join(children)}]"
-                    return f"React.createElement('{tag_name}', {props_str}, {children_str})"
-                else:
-                    return f"React.createElement('{tag_name}', {props_str})"
+                # Write children straight into the buffer
+                if call_node.args:
+                    out.write(", [")
+                    for index, arg in enumerate(call_node.args):
+                        if index:
+                            out.write(", ")
+                        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                            out.write(f'"{arg.value}"')
+                        else:
+                            self._transpile_element_expression(arg, out)
+                    out.write("]")
+                
+                out.write(")")
+                return
         
-        return "null"
+        out.write(_JS_NULL)
     
     def _transpile_prop_value(self, value_node):
         """
@@ -733,11 +1333,9 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript prop value
         """
-        if isinstance(value_node, ast.Attribute):
-            if (isinstance(value_node.value, ast.Name) and 
-                value_node.value.id == 'self'):
-                # This is a method reference like self.increment
-                return value_node.attr
+        if self._is_self_attr(value_node):
+            # This is a method reference like self.increment
+            return value_node.attr
         
         return self._transpile_expression(value_node)
     
@@ -752,13 +1350,10 @@ class PyReactTranspiler:
             str: JavaScript object
         """
         if not props_dict:
-            return "null"
+            return _JS_NULL
         
-        prop_pairs = []
-        for key, value in props_dict.items():
-            prop_pairs.append(f"{key}: {value}")
-        
-        return "{" + ", ".join(prop_pairs) + "}"
+        # Values are already JavaScript expressions
+        return "{" + ", ".join(f"{key}: {value}" for key, value in props_dict.items()) + "}"
     
     def _transpile_dict_literal(self, dict_node):
         """
@@ -788,10 +1383,8 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript property access
         """
-        if (isinstance(attr_node.value, ast.Name) and 
-            attr_node.value.id == 'self' and 
-            attr_node.attr == 'state'):
-            return "state"
+        if self._is_self_attr(attr_node, _STATE):
+            return _JS_STATE
         
         return f"{self._transpile_expression(attr_node.value)}.{attr_node.attr}"
     
@@ -805,25 +1398,13 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript binary operation
         """
+        # State subscripts on either side are handled by _transpile_expression
         left = self._transpile_expression(binop_node.left)
         right = self._transpile_expression(binop_node.right)
         
-        # Handle state access in binary operations
-        if (isinstance(binop_node.left, ast.Subscript) and
-            isinstance(binop_node.left.value, ast.Attribute) and
-            isinstance(binop_node.left.value.value, ast.Name) and
-            binop_node.left.value.value.id == 'self' and
-            binop_node.left.value.attr == 'state'):
-            left = self._transpile_subscript(binop_node.left)
-        
-        if isinstance(binop_node.op, ast.Add):
-            return f"{left} + {right}"
-        elif isinstance(binop_node.op, ast.Sub):
-            return f"{left} - {right}"
-        elif isinstance(binop_node.op, ast.Mult):
-            return f"{left} * {right}"
-        elif isinstance(binop_node.op, ast.Div):
-            return f"{left} / {right}"
+        operator = _BINOP_SYMBOLS.get(type(binop_node.op))
+        if operator:
+            return f"{left} {operator} {right}"
         else:
             return f"{left} {right}"
     
@@ -842,25 +1423,33 @@ class PyReactTranspiler:
             if isinstance(value, ast.Constant):
                 parts.append(value.value)
             elif isinstance(value, ast.FormattedValue):
-                # Check if this is a simple variable name that might be local
-                if isinstance(value.value, ast.Name):
-                    var_name = value.value.id
-                    # Check if it's a tracked local variable
-                    if hasattr(self, 'local_variables') and var_name in self.local_variables:
-                        parts.append(f"${{{var_name}}}")
-                    else:
-                        expr_js = self._transpile_expression(value.value)
-                        parts.append(f"${{{expr_js}}}")
-                else:
-                    expr_js = self._transpile_expression(value.value)
-                    # Handle subscript access for state
-                    if isinstance(value.value, ast.Subscript):
-                        expr_js = self._transpile_subscript(value.value)
-                    parts.append(f"${{{expr_js}}}")
+                # Names (including render locals) and state subscripts are
+                # all handled by the expression dispatch
+                expr_js = self._transpile_expression(value.value)
+                parts.append(f"${{{expr_js}}}")
+        
+        return "`" + "".join(parts) + "`"
+    
+    def _transpile_text(self, call_node):
+        """
+        Transpile Text(...) calls to JavaScript template literals.
+        
+        Args:
+            call_node: AST Call node for Text
+            
+        Returns:
+            str: JavaScript template literal
+        """
+        parts = []
+        for arg in call_node.args:
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                parts.append(arg.value)
+            else:
+                parts.append(f"${{{self._transpile_expression(arg)}}}")
         
         return "`" + "".join(parts) + "`"
     
-    def _transpile_subscript(self, subscript_node):
+    def _transpile_subscript(self, subscript_node: ast.Subscript) -> str:
         """
         Transpile subscript access like self.state['count'].
         
@@ -870,18 +1459,22 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript property access
         """
-        if (isinstance(subscript_node.value, ast.Attribute) and
-            isinstance(subscript_node.value.value, ast.Name) and
-            subscript_node.value.value.id == 'self' and
-            subscript_node.value.attr == 'state'):
-            
-            if isinstance(subscript_node.slice, ast.Constant):
-                key = subscript_node.slice.value
-                return f"state.{key}"
+        # Only constant keys on self.state or a mutator's state argument are supported
+        key = subscript_node.slice
+        if type(key) is not ast.Constant:
+            return _JS_NULL
+        
+        value = subscript_node.value
+        value_type = type(value)
+        if value_type is ast.Attribute:
+            if self._is_self_attr(value, _STATE):
+                return f"state.{key.value}"
+        elif value_type is ast.Name and value.id in self.state_params:
+            return f"{value.id}.{key.value}"
         
-        return "null"
+        return _JS_NULL
     
-    def _transpile_function_call(self, call_node):
+    def _transpile_function_call(self, call_node: ast.Call) -> str:
         """
         Transpile function calls.
         
@@ -891,30 +1484,50 @@ class PyReactTranspiler:
         Returns:
             str: JavaScript function call
         """
-        if isinstance(call_node.func, ast.Name):
-            func_name = call_node.func.id
-            args = [self._transpile_expression(arg) for arg in call_node.args]
-            return f"{func_name}({', '.join(args)})"
-        elif isinstance(call_node.func, ast.Attribute):
-            # Handle method calls like self.props.get()
-            obj_js = self._transpile_expression(call_node.func.value)
-            method_name = call_node.func.attr
-            args = [self._transpile_expression(arg) for arg in call_node.args]
-            
-            # Special handling for self.props.get() - use logical OR for fallback
-            if (isinstance(call_node.func.value, ast.Attribute) and
-                isinstance(call_node.func.value.value, ast.Name) and
-                call_node.func.value.value.id == 'self' and
-                call_node.func.value.attr == 'props' and
-                method_name == 'get' and len(args) == 2):
-                # Convert self.props.get('key', default) to (props.key || default)
-                key_arg = args[0].strip('"\'')  # Remove quotes from string literal
-                default_arg = args[1]
-                return f"(props.{key_arg} || {default_arg})"
+        handler = self._CALL_DISPATCH.get(type(call_node.func))
+        return _JS_NULL if handler is None else handler(self, call_node)
+    
+    def _transpile_name_call(self, call_node: ast.Call) -> str:
+        """Transpile a call of a plain name, like Text(...) or len(...)."""
+        func_name = call_node.func.id
+        if func_name == 'Text':
+            return self._transpile_text(call_node)
+        args = [self._transpile_expression(arg) for arg in call_node.args]
+        return f"{func_name}({', '.join(args)})"
+    
+    def _transpile_attribute_call(self, call_node: ast.Call) -> str:
+        """Transpile a method call on an object, like self.props.get(...)."""
+        # Convert self.props.get('key', default) to (props.key || default),
+        # transpiling only the default
+        props_key = self._is_props_get(call_node)
+        if props_key is not None:
+            default_arg = self._transpile_expression(call_node.args[1])
+            return f"(props.{props_key} || {default_arg})"
+        
+        obj_js = self._transpile_expression(call_node.func.value)
+        method_name = call_node.func.attr
+        args = [self._transpile_expression(arg) for arg in call_node.args]
+        return f"{obj_js}.{method_name}({', '.join(args)})"
+    
+    @classmethod
+    def _is_props_get(cls, call_node: ast.Call) -> Optional[str]:
+        """
+        Check whether a call is self.props.get('key', default).
+        
+        Args:
+            call_node: AST Call node
             
-            return f"{obj_js}.{method_name}({', '.join(args)})"
+        Returns:
+            str: The props key if the call matches, otherwise None
+        """
+        func = call_node.func
+        if (type(func) is ast.Attribute and func.attr == _GET and
+            len(call_node.args) == 2 and cls._is_self_attr(func.value, _PROPS)):
+            key = call_node.args[0]
+            if type(key) is ast.Constant and type(key.value) is str:
+                return key.value
         
-        return "null"
+        return None
     
     def generate_html_page(self, components: List[str], title: str = "PyReact App") -> str:
         """
@@ -927,92 +1540,83 @@ class PyReactTranspiler:
         Returns:
             str: Complete HTML page
         """
-        # Generate the complete JavaScript code
+        # A repeated request can reuse the last page if the bundle is unchanged;
+        # the bundle memo returns the same string until the components change.
+        # Only that page is kept, since pages can be large
+        components = tuple(components)
+        key = (components, title)
         js_code = self.generate_complete_js()
+        if (self._page_cache is not None and self._page_cache[0] == key and
+                self._page_cache[1] is js_code):
+            return self._page_cache[2]
         
-        # Create the render calls for each component
-        render_calls = []
-        for component_name in components:
-            render_calls.append(f"    ReactDOM.render(React.createElement({component_name}), document.getElementById('{component_name.lower()}-root'));")
+        page = self._render_html_page(components, title, js_code)
+        self._page_cache = (key, js_code, page)
+        return page
+    
+    def _render_html_page(self, components: List[str], title: str, js_code: str) -> str:
+        """
+        Wrap already generated JavaScript in a complete HTML page.
         
-        # Create container divs for each component
-        container_divs = []
-        for component_name in components:
-            container_divs.append(f'    <div id="{component_name.lower()}-root"></div>')
+        Args:
+            components: List of component names to render
+            title: Page title
+            js_code: Complete JavaScript code for the components
+            
+        Returns:
+            str: Complete HTML page
+        """
+        return "".join(self._iter_html_page(components, title, js_code))
+    
+    def _iter_html_page(self, components: List[str], title: str, js_code: str):
+        """
+        Produce an HTML page as a sequence of strings, one piece per component.
         
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://unpkg.com/react@17/umd/react.development.js"></script>
-    <script src="https://unpkg.com/react-dom@17/umd/react-dom.development.js"></script>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        
-        .component-container {{
-            background: white;
-            padding: 20px;
-            margin: 20px 0;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        button {{
-            background-color: #007bff;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 16px;
-            margin: 5px;
-        }}
-        
-        button:hover {{
-            background-color: #0056b3;
-        }}
-        
-        h1, h2, h3 {{
-            color: #333;
-        }}
-        
-        .counter {{
-            text-align: center;
-            padding: 20px;
-        }}
-        
-        .counter h1 {{
-            font-size: 2em;
-            margin-bottom: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <h1>{title}</h1>
-    <p>Components generated by PyReact - Python to JavaScript React Transpiler</p>
+        Args:
+            components: Sequence of component names to render; it is walked twice
+            title: Page title
+            js_code: Complete JavaScript code for the components
+            
+        Yields:
+            str: Consecutive pieces of the page
+        """
+        # Fragments of stored components were built when they were stored; they
+        # are looked up per piece so no per-page list of them is kept
+        stored = self._fragments
+        fields = {'title': title, 'css': _CSS_MIN, 'js_code': js_code}
+        
+        for literal, field in _HTML_TEMPLATE_PARTS:
+            yield literal
+            if field == 'container_divs':
+                # Create container divs for each component
+                for name in components:
+                    yield (stored.get(name) or self._page_fragments(name))[0]
+            elif field == 'render_calls':
+                # Create the render calls for each component, one per line
+                separator = ""
+                for name in components:
+                    yield separator + (stored.get(name) or self._page_fragments(name))[1]
+                    separator = "\n"
+            elif field is not None:
+                yield fields[field]
     
-{"".join(container_divs)}
-
-    <script>
-{js_code}
-
-    // Render components
-{chr(10).join(render_calls)}
-    </script>
-</body>
-</html>"""
+    @staticmethod
+    def _page_fragments(component_name: str):
+        """
+        Build the container div and render call for a component on the HTML page.
         
-        return html_template
+        Args:
+            component_name: Name of the component
+            
+        Returns:
+            tuple: (container div, render call)
+        """
+        lower_name = component_name.lower()
+        return (_CONTAINER_PREFIX + lower_name + _CONTAINER_SUFFIX,
+                _RENDER_CALL_PREFIX + component_name + _RENDER_CALL_MIDDLE + lower_name + _RENDER_CALL_SUFFIX)
     
-    def save_html_demo(self, components: List[str], filename: str = "pyreact_demo.html", title: str = "PyReact Demo") -> str:
+    def save_html_demo(self, components: List[str], filename: str = "pyreact_demo.html", title: str = "PyReact Demo",
+                       prebuilt_js: Optional[str] = None) -> str:
         """
         Generate and save an HTML demo page.
         
@@ -1020,16 +1624,156 @@ class PyReactTranspiler:
             components: List of component names to render
             filename: Output filename
             title: Page title
+            prebuilt_js: Complete JavaScript from generate_complete_js, if already built
             
         Returns:
             str: Path to saved HTML file
         """
-        html_content = self.generate_html_page(components, title)
+        if prebuilt_js is None:
+            prebuilt_js = self.generate_complete_js()
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the page to the file instead of joining it into one string first;
+        # the names are kept so the pieces can be produced a second time
+        components = tuple(components)
+        self._write_if_changed(filename, lambda: self._iter_html_page(components, title, prebuilt_js))
         
         return filename
+    
+    def _write_if_changed(self, filename: str, pieces) -> bool:
+        """
+        Write text to a file unless the file already holds exactly that text.
+        
+        Skipping identical writes avoids needless disk I/O and keeps file
+        watchers quiet when components have not changed. The text is compared
+        and written one piece at a time, so it is never held in memory whole.
+        
+        Args:
+            filename: Output filename
+            pieces: Callable returning an iterable of text pieces, encoded as
+                UTF-8; it is called again to write the file if the text differs
+            
+        Returns:
+            bool: True if the file was written
+        """
+        if self._file_matches(filename, pieces()):
+            return False
+        
+        with open(filename, 'wb') as f:
+            for piece in pieces():
+                f.write(piece.encode('utf-8'))
+        
+        return True
+    
+    @staticmethod
+    def _file_matches(filename: str, pieces) -> bool:
+        """
+        Check whether a file holds exactly the given text, stopping at the first difference.
+        
+        Args:
+            filename: File to compare against
+            pieces: Iterable of text pieces, encoded as UTF-8
+            
+        Returns:
+            bool: True if the file exists and its content equals the pieces joined
+        """
+        try:
+            with open(filename, 'rb') as f:
+                for piece in pieces:
+                    data = piece.encode('utf-8')
+                    if f.read(len(data)) != data:
+                        return False
+                # The file must not continue past the text
+                return not f.read(1)
+        except OSError:
+            return False
+    
+    def build(self, components, html_path: Optional[str] = None, title: str = "PyReact Demo") -> str:
+        """
+        Transpile components and bundle them, optionally writing an HTML page.
+        
+        The bundle is assembled once and reused for the HTML page, instead of
+        calling transpile_component, generate_complete_js and save_html_demo
+        separately.
+        
+        Args:
+            components: List of component classes to transpile and render
+            html_path: Output filename for the HTML page, or None to skip it
+            title: Page title
+            
+        Returns:
+            str: Complete JavaScript code
+        """
+        for component_class in components:
+            self.transpile_component(component_class)
+        
+        js_code = self.generate_complete_js()
+        
+        if html_path:
+            names = [component_class.__name__ for component_class in components]
+            self.save_html_demo(names, html_path, title, prebuilt_js=js_code)
+        
+        return js_code
+
+    
+    # Handlers by exact AST node type, looked up once per node instead of
+    # walking an isinstance chain
+    _EXPRESSION_DISPATCH = {
+        ast.Dict: _transpile_dict_literal,
+        ast.Constant: _transpile_constant,
+        ast.Name: _transpile_name,
+        ast.Attribute: _transpile_attribute_access,
+        ast.BinOp: _transpile_binary_operation,
+        ast.JoinedStr: _transpile_f_string,
+        ast.Call: _transpile_function_call,
+        ast.Subscript: _transpile_subscript,
+    }
+    
+    _STATEMENT_DISPATCH = {
+        ast.Expr: _transpile_expression_statement,
+        ast.Assign: _transpile_assignment,
+        ast.AugAssign: _transpile_aug_assignment,
+        ast.Return: _transpile_return,
+        ast.FunctionDef: _transpile_local_function,
+    }
+    
+    _VALUE_DISPATCH = {
+        ast.Constant: _transpile_constant,
+        ast.List: _list_to_js_value,
+        ast.Dict: _dict_to_js_value,
+    }
+    
+    # Handlers for function calls by the exact type of the called expression
+    _CALL_DISPATCH = {
+        ast.Name: _transpile_name_call,
+        ast.Attribute: _transpile_attribute_call,
+    }
+
+
+def component(component_class):
+    """
+    Class decorator that parses and transpiles a component once, when it is defined.
+    
+    The parsed class definition is stored on the class as ``__pyreact_ast__`` and
+    the generated JavaScript as ``__pyreact_js__``; later
+    ``PyReactTranspiler.transpile_component`` calls return the JavaScript directly.
+    
+    Classes whose source cannot be read (defined with exec, in a REPL, or
+    installed without .py files) are returned undecorated, so defining them
+    still works and only an actual transpile_component call fails.
+    
+    Args:
+        component_class: The Component subclass to transpile
+        
+    Returns:
+        The same class, with ``__pyreact_ast__`` and ``__pyreact_js__`` set
+    """
+    transpiler = PyReactTranspiler()
+    try:
+        class_def = transpiler._parse_component_class(component_class)
+    except (OSError, TypeError):
+        return component_class
+    component_class.__pyreact_js__ = transpiler._transpile_class_def(class_def)
+    return component_class
 
 
 if __name__ == "__main__":